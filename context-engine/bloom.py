@@ -0,0 +1,60 @@
+"""
+⟡ Mirror Intelligence — Seen-Article Bloom Filter
+Compact, persistent membership test for articles ingested on earlier runs.
+"""
+
+import hashlib
+import math
+import os
+import struct
+from typing import Iterator
+
+_HEADER = struct.Struct("<QI")  # bit count, probe count
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over 128-bit blake2b signatures (double hashing)."""
+
+    def __init__(self, capacity: int = 500_000, error_rate: float = 1e-5):
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.probes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    @staticmethod
+    def signature(*parts: str) -> bytes:
+        return hashlib.blake2b("\x1f".join(parts).encode("utf-8"), digest_size=16).digest()
+
+    def _positions(self, sig: bytes) -> Iterator[int]:
+        h1 = int.from_bytes(sig[:8], "little")
+        h2 = int.from_bytes(sig[8:], "little") | 1
+        for i in range(self.probes):
+            yield (h1 + i * h2) % self.size
+
+    def __contains__(self, sig: bytes) -> bool:
+        bits = self.bits
+        return all(bits[p >> 3] & (1 << (p & 7)) for p in self._positions(sig))
+
+    def add(self, sig: bytes) -> None:
+        for p in self._positions(sig):
+            self.bits[p >> 3] |= 1 << (p & 7)
+
+    def save(self, path: str) -> None:
+        tmp = f"{path}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(_HEADER.pack(self.size, self.probes))
+            f.write(self.bits)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str, **kwargs) -> "BloomFilter":
+        """Load a saved filter, or start an empty one if the file is missing/corrupt."""
+        bloom = cls(**kwargs)
+        try:
+            with open(path, "rb") as f:
+                size, probes = _HEADER.unpack(f.read(_HEADER.size))
+                bits = bytearray(f.read())
+        except (FileNotFoundError, struct.error):
+            return bloom
+        if len(bits) == (size + 7) // 8:
+            bloom.size, bloom.probes, bloom.bits = size, probes, bits
+        return bloom
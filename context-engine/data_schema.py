@@ -1,8 +1,11 @@
 from pydantic import BaseModel, Field
 from typing import List, Optional, Literal, Dict, Any
 from datetime import datetime
+from pathlib import Path
 import hashlib
 import json
+import os
+import orjson
 
 # ═══════════════════════════════════════════════════════════════
 # TRUTH LEDGER PRIMITIVES
@@ -214,14 +217,20 @@ class PortalData(BaseModel):
     mind: LivingMind
 
     def to_json_file(self, path: str) -> None:
-        with open(path, "w") as f:
-            json.dump(self.model_dump(), f, indent=4, default=str)
+        # Write a sibling temp file and rename over the target, so readers never
+        # see a half-written data.json
+        tmp = f"{path}.tmp"
+        Path(tmp).write_bytes(orjson.dumps(
+            self.model_dump(),
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            default=str
+        ))
+        os.replace(tmp, path)
 
     @classmethod
     def from_json_file(cls, path: str) -> "PortalData":
         try:
-            with open(path) as f:
-                return cls.model_validate(json.load(f))
+            return cls.model_validate(orjson.loads(Path(path).read_bytes()))
         except FileNotFoundError:
             return cls(
                 meta=Meta(date=datetime.now().strftime("%A, %B %d, %Y")),
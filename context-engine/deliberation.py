@@ -152,8 +152,20 @@ class ModelClient:
     
     def __init__(self, config: ModelConfig):
         self.config = config
+        self._client: Optional[httpx.AsyncClient] = None
         self._check_availability()
     
+    async def _get_client(self) -> httpx.AsyncClient:
+        """One pooled client per model, so keep-alive and TLS sessions survive between calls."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=60.0)
+        return self._client
+    
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
     def _check_availability(self):
         """Check if this model is available."""
         if self.config.provider == ModelProvider.OLLAMA:
@@ -184,106 +196,106 @@ class ModelClient:
     
     async def _ollama_generate(self, prompt: str, system: str = None) -> tuple[str, int]:
         start = datetime.now()
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            payload = {
-                "model": self.config.model_id,
-                "prompt": prompt,
-                "stream": False
-            }
-            if system:
-                payload["system"] = system
-            
-            resp = await client.post(f"{self.config.base_url}/api/generate", json=payload)
-            resp.raise_for_status()
-            result = resp.json()
-            text = result.get("response", "").strip()
-            
-            # Strip thinking blocks
-            if "</think>" in text.lower():
-                idx = text.lower().find("</think>") + len("</think>")
-                text = text[idx:].strip()
-            
-            latency = int((datetime.now() - start).total_seconds() * 1000)
-            return text, latency
+        client = await self._get_client()
+        payload = {
+            "model": self.config.model_id,
+            "prompt": prompt,
+            "stream": False
+        }
+        if system:
+            payload["system"] = system
+        
+        resp = await client.post(f"{self.config.base_url}/api/generate", json=payload, timeout=120.0)
+        resp.raise_for_status()
+        result = resp.json()
+        text = result.get("response", "").strip()
+        
+        # Strip thinking blocks
+        if "</think>" in text.lower():
+            idx = text.lower().find("</think>") + len("</think>")
+            text = text[idx:].strip()
+        
+        latency = int((datetime.now() - start).total_seconds() * 1000)
+        return text, latency
     
     async def _openai_generate(self, prompt: str, system: str = None) -> tuple[str, int]:
         start = datetime.now()
         api_key = os.environ.get(self.config.api_key_env, "")
         
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            messages = []
-            if system:
-                messages.append({"role": "system", "content": system})
-            messages.append({"role": "user", "content": prompt})
-            
-            resp = await client.post(
-                f"{self.config.base_url}/chat/completions",
-                headers={"Authorization": f"Bearer {api_key}"},
-                json={
-                    "model": self.config.model_id,
-                    "messages": messages,
-                    "max_tokens": 1000
-                }
-            )
-            resp.raise_for_status()
-            result = resp.json()
-            text = result["choices"][0]["message"]["content"]
-            latency = int((datetime.now() - start).total_seconds() * 1000)
-            return text, latency
+        client = await self._get_client()
+        messages = []
+        if system:
+            messages.append({"role": "system", "content": system})
+        messages.append({"role": "user", "content": prompt})
+        
+        resp = await client.post(
+            f"{self.config.base_url}/chat/completions",
+            headers={"Authorization": f"Bearer {api_key}"},
+            json={
+                "model": self.config.model_id,
+                "messages": messages,
+                "max_tokens": 1000
+            }
+        )
+        resp.raise_for_status()
+        result = resp.json()
+        text = result["choices"][0]["message"]["content"]
+        latency = int((datetime.now() - start).total_seconds() * 1000)
+        return text, latency
     
     async def _anthropic_generate(self, prompt: str, system: str = None) -> tuple[str, int]:
         start = datetime.now()
         api_key = os.environ.get(self.config.api_key_env, "")
         
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            payload = {
-                "model": self.config.model_id,
-                "max_tokens": 1000,
-                "messages": [{"role": "user", "content": prompt}]
-            }
-            if system:
-                payload["system"] = system
-            
-            resp = await client.post(
-                f"{self.config.base_url}/messages",
-                headers={
-                    "x-api-key": api_key,
-                    "anthropic-version": "2023-06-01",
-                    "content-type": "application/json"
-                },
-                json=payload
-            )
-            resp.raise_for_status()
-            result = resp.json()
-            text = result["content"][0]["text"]
-            latency = int((datetime.now() - start).total_seconds() * 1000)
-            return text, latency
+        client = await self._get_client()
+        payload = {
+            "model": self.config.model_id,
+            "max_tokens": 1000,
+            "messages": [{"role": "user", "content": prompt}]
+        }
+        if system:
+            payload["system"] = system
+        
+        resp = await client.post(
+            f"{self.config.base_url}/messages",
+            headers={
+                "x-api-key": api_key,
+                "anthropic-version": "2023-06-01",
+                "content-type": "application/json"
+            },
+            json=payload
+        )
+        resp.raise_for_status()
+        result = resp.json()
+        text = result["content"][0]["text"]
+        latency = int((datetime.now() - start).total_seconds() * 1000)
+        return text, latency
     
     async def _openai_compatible_generate(self, prompt: str, system: str = None) -> tuple[str, int]:
         """For DeepSeek, Groq, and other OpenAI-compatible APIs."""
         start = datetime.now()
         api_key = os.environ.get(self.config.api_key_env, "")
         
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            messages = []
-            if system:
-                messages.append({"role": "system", "content": system})
-            messages.append({"role": "user", "content": prompt})
-            
-            resp = await client.post(
-                f"{self.config.base_url}/chat/completions",
-                headers={"Authorization": f"Bearer {api_key}"},
-                json={
-                    "model": self.config.model_id,
-                    "messages": messages,
-                    "max_tokens": 1000
-                }
-            )
-            resp.raise_for_status()
-            result = resp.json()
-            text = result["choices"][0]["message"]["content"]
-            latency = int((datetime.now() - start).total_seconds() * 1000)
-            return text, latency
+        client = await self._get_client()
+        messages = []
+        if system:
+            messages.append({"role": "system", "content": system})
+        messages.append({"role": "user", "content": prompt})
+        
+        resp = await client.post(
+            f"{self.config.base_url}/chat/completions",
+            headers={"Authorization": f"Bearer {api_key}"},
+            json={
+                "model": self.config.model_id,
+                "messages": messages,
+                "max_tokens": 1000
+            }
+        )
+        resp.raise_for_status()
+        result = resp.json()
+        text = result["choices"][0]["message"]["content"]
+        latency = int((datetime.now() - start).total_seconds() * 1000)
+        return text, latency
 
 # ═══════════════════════════════════════════════════════════════
 # DELIBERATION ENGINE
@@ -296,6 +308,9 @@ class DeliberationEngine:
         self.event_callback = event_callback
         self.clients: Dict[str, ModelClient] = {}
         self.current_session: Optional[DeliberationSession] = None
+        # The engine is shared (get_deliberation_engine) and current_session is per-run
+        # state, so overlapping runs (/api/refresh + /api/deliberate) take turns
+        self._run_lock = asyncio.Lock()
         self._init_clients()
     
     def _init_clients(self):
@@ -309,6 +324,11 @@ class DeliberationEngine:
         if not self.clients:
             self.clients["local"] = ModelClient(MODELS["local"])
     
+    async def aclose(self) -> None:
+        """Close every model client's connection pool."""
+        for client in self.clients.values():
+            await client.aclose()
+    
     def get_available_models(self) -> List[Dict]:
         """Return list of available models with their status."""
         return [
@@ -334,29 +354,30 @@ class DeliberationEngine:
             await self.event_callback(event)
     
     async def deliberate(self, topic: str, context: str) -> DeliberationSession:
-        """Run full deliberation cycle."""
-        session_id = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-        self.current_session = DeliberationSession(
-            session_id=session_id,
-            topic=topic,
-            context=context,
-            started_at=datetime.utcnow().isoformat() + "Z"
-        )
-        
-        # Phase 1: Initial Takes
-        await self._phase_initial_takes(context)
-        
-        # Phase 2: Cross-Response
-        await self._phase_cross_response()
-        
-        # Phase 3: Synthesis
-        await self._phase_synthesis()
-        
-        self.current_session.completed_at = datetime.utcnow().isoformat() + "Z"
-        self.current_session.phase = "complete"
-        await self._emit("deliberation_complete", {"session_id": session_id})
-        
-        return self.current_session
+        """Run full deliberation cycle. Concurrent calls run one after another."""
+        async with self._run_lock:
+            session_id = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+            self.current_session = DeliberationSession(
+                session_id=session_id,
+                topic=topic,
+                context=context,
+                started_at=datetime.utcnow().isoformat() + "Z"
+            )
+            
+            # Phase 1: Initial Takes
+            await self._phase_initial_takes(context)
+            
+            # Phase 2: Cross-Response
+            await self._phase_cross_response()
+            
+            # Phase 3: Synthesis
+            await self._phase_synthesis()
+            
+            self.current_session.completed_at = datetime.utcnow().isoformat() + "Z"
+            self.current_session.phase = "complete"
+            await self._emit("deliberation_complete", {"session_id": session_id})
+            
+            return self.current_session
     
     async def _phase_initial_takes(self, context: str):
         """Each model produces initial take."""
@@ -602,6 +623,17 @@ FINAL_PROBABILITY: [If applicable, 0.0 to 1.0, otherwise N/A]
         })
 
 
+# Shared engine, so model clients and their connection pools are built once
+_engine: Optional[DeliberationEngine] = None
+
+def get_deliberation_engine() -> DeliberationEngine:
+    """Get the singleton DeliberationEngine."""
+    global _engine
+    if _engine is None:
+        _engine = DeliberationEngine()
+    return _engine
+
+
 # ═══════════════════════════════════════════════════════════════
 # STANDALONE TEST
 # ═══════════════════════════════════════════════════════════════
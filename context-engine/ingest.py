@@ -4,11 +4,17 @@ Fetches data from high-signal RSS feeds and news APIs.
 """
 
 import asyncio
-import feedparser
+import functools
+import heapq
+import os
+import re
 import httpx
+import orjson
 from datetime import datetime
-from typing import List, Dict, Optional, AsyncGenerator, Any
+from typing import List, Dict, Optional, AsyncGenerator, Any, Set, Iterable, Iterator, Tuple
 from dataclasses import dataclass
+from operator import attrgetter
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
 
 # ═══════════════════════════════════════════════════════════════
 # CONFIGURATION
@@ -18,30 +24,52 @@ from dataclasses import dataclass
 # CONFIGURATION
 # ═══════════════════════════════════════════════════════════════
 
+# Max feeds fetched at once, and the deadline for a whole ingest_all pass.
+# Kept separate from the per-request httpx timeout so one stuck feed can't wedge the run.
+INGEST_CONCURRENCY = int(os.environ.get("INGEST_CONCURRENCY", "16"))
+INGEST_TIMEOUT = float(os.environ.get("INGEST_TIMEOUT", "60"))
+
+# Opt-in: path of a Bloom filter persisted across runs. When set, articles seen on
+# an earlier run are dropped at parse time so only new items reach the council.
+SEEN_FILTER_PATH = os.environ.get("INGEST_SEEN_FILTER") or None
+
+# Per-feed ETag/Last-Modified validators plus the sources they produced, so unchanged
+# feeds answer 304 and skip download and parsing entirely
+FEED_CACHE_PATH = os.environ.get("INGEST_FEED_CACHE") or os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "feeds_cache.json")
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
+
+def _parse_feeds(lines: Iterable[str]) -> Iterator[Dict]:
+    """Yield feed configs from feeds.txt lines; "# Heading" lines set the category."""
+    current_category = "General"
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        if line[0] == "#":
+            current_category = line.lstrip("# ").strip()
+            continue
+        yield {
+            "name": f"{current_category} Feed",
+            "url": line,
+            "tier": 1
+        }
+
+@functools.lru_cache(maxsize=4)
+def _load_feeds_cached(full_path: str, mtime_ns: int) -> Tuple[Dict, ...]:
+    # mtime_ns is part of the cache key, so an edited feeds.txt is re-read
+    with open(full_path, "r") as f:
+        return tuple(_parse_feeds(f))
+
 def load_feeds(path: str = "feeds.txt") -> List[Dict]:
-    import os
     # Resolve relative to this file
     base_dir = os.path.dirname(os.path.abspath(__file__))
     full_path = os.path.join(base_dir, path)
-    feeds = []
     try:
-        with open(full_path, "r") as f:
-            lines = f.readlines()
-        
-        current_category = "General"
-        for line in lines:
-            line = line.strip()
-            if not line or line.startswith("#"):
-                if line.startswith("#"):
-                    current_category = line.lstrip("# ").strip()
-                continue
-            
-            # Simple deduplication by URL logic could happen here
-            feeds.append({
-                "name": f"{current_category} Feed", 
-                "url": line,
-                "tier": 1
-            })
+        mtime_ns = os.stat(full_path).st_mtime_ns
+        return [dict(feed) for feed in _load_feeds_cached(full_path, mtime_ns)]
     except FileNotFoundError:
         print("Warning: feeds.txt not found, using defaults.")
         return [
@@ -51,11 +79,23 @@ def load_feeds(path: str = "feeds.txt") -> List[Dict]:
             {"name": "Ars Technica", "url": "https://feeds.arstechnica.com/arstechnica/technology-lab", "tier": 2},
             {"name": "Hacker News", "url": "https://hnrss.org/frontpage?points=100", "tier": 2}
         ]
-    return feeds
 
 RSS_SOURCES = load_feeds()
 
 
+def normalize_url(url: str) -> str:
+    """Canonical form of an article URL for cross-feed deduplication.
+
+    Drops utm_* tracking params and the fragment, which feeds append per-syndicator,
+    lowercases scheme/host and ignores a trailing slash ("http://x/a" == "http://x/a/").
+    """
+    parts = urlsplit(url.strip())
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+             if not k.lower().startswith("utm_")]
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip("/"),
+                       urlencode(query), ""))
+
+
 @dataclass
 class IngestEvent:
     """An ingestion event for logging/streaming."""
@@ -77,24 +117,88 @@ class IngestEvent:
 # ═══════════════════════════════════════════════════════════════
 
 from data_schema import Source
+from fast_feed import parse_feed
+from bloom import BloomFilter
+
+
+def _seen_signature(source: Source) -> bytes:
+    """Seen-filter key for an article; same URL normalization as ingest_all's dedup."""
+    return BloomFilter.signature(normalize_url(source.url), source.title)
 
 # ═══════════════════════════════════════════════════════════════
 # INGESTION ENGINE
 # ═══════════════════════════════════════════════════════════════
 
 class IngestEngine:
-    """Fetches and parses content from RSS feeds."""
+    """Fetches and parses content from RSS feeds.
+    
+    Use as an async context manager so the pooled HTTP client is closed:
+        async with IngestEngine() as engine: ...
+    """
     
-    def __init__(self, event_callback=None):
+    def __init__(self, event_callback=None, max_items: int = 10,
+                 seen_filter_path: Optional[str] = SEEN_FILTER_PATH,
+                 max_sources: Optional[int] = None,
+                 feed_cache_path: Optional[str] = FEED_CACHE_PATH):
         self.event_callback = event_callback
+        self.max_items = max_items  # Most recent entries kept per feed
+        self.max_sources = max_sources  # Newest unique sources kept overall; None keeps all
         self.sources: List[Source] = []
+        self._client: Optional[httpx.AsyncClient] = None
+        self._sem = asyncio.Semaphore(INGEST_CONCURRENCY)
+        self.seen_filter_path = seen_filter_path
+        self.seen: Optional[BloomFilter] = BloomFilter.load(seen_filter_path) if seen_filter_path else None
+        self._ctx_cache: Dict[tuple, str] = {}
+        self.feed_cache_path = feed_cache_path
+        self._cond_cache: Dict[str, Dict[str, Any]] = self._load_feed_cache()
+        self._cond_dirty = False
+    
+    async def __aenter__(self) -> "IngestEngine":
+        return self
+    
+    async def __aexit__(self, *exc) -> None:
+        await self.aclose()
+    
+    async def _get_client(self) -> httpx.AsyncClient:
+        """One pooled client for every feed, so keep-alive and TLS sessions are reused."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=15.0,
+                follow_redirects=True,
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=32, keepalive_expiry=30)
+            )
+        return self._client
+    
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
+    def _load_feed_cache(self) -> Dict[str, Dict[str, Any]]:
+        if not self.feed_cache_path:
+            return {}
+        try:
+            with open(self.feed_cache_path, "rb") as f:
+                return orjson.loads(f.read())
+        except (FileNotFoundError, orjson.JSONDecodeError):
+            return {}
+    
+    def _save_feed_cache(self) -> None:
+        tmp = f"{self.feed_cache_path}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(orjson.dumps(self._cond_cache))
+        os.replace(tmp, self.feed_cache_path)
     
     async def _emit(self, event: IngestEvent):
         if self.event_callback:
             await self.event_callback(event)
     
-    async def fetch_rss(self, feed_config: Dict) -> List[Source]:
+    async def fetch_rss(self, feed_config: Dict, max_items: Optional[int] = None) -> List[Source]:
         """Fetch articles from a single RSS feed."""
+        async with self._sem:
+            return await self._fetch_rss(feed_config, max_items or self.max_items)
+    
+    async def _fetch_rss(self, feed_config: Dict, max_items: int) -> List[Source]:
         await self._emit(IngestEvent(
             source=feed_config["name"],
             status="fetching",
@@ -102,27 +206,66 @@ class IngestEngine:
         ))
         
         try:
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                response = await client.get(feed_config["url"], follow_redirects=True)
-                response.raise_for_status()
-                
+            url = feed_config["url"]
+            cached = self._cond_cache.get(url) if self.feed_cache_path else None
+            headers = {}
+            if cached:
+                if cached.get("etag"):
+                    headers["If-None-Match"] = cached["etag"]
+                if cached.get("last_modified"):
+                    headers["If-Modified-Since"] = cached["last_modified"]
+            
+            client = await self._get_client()
+            response = await client.get(url, headers=headers)
+            
+            if response.status_code == 304 and cached:
+                # Unchanged since last run. With the seen filter on, drop cached
+                # items that a previous run already kept.
+                sources = [Source.model_validate(d) for d in cached["sources"]]
+                if self.seen is not None:
+                    sources = [src for src in sources if _seen_signature(src) not in self.seen]
+                await self._emit(IngestEvent(
+                    source=feed_config["name"],
+                    status="complete",
+                    message=f"Not modified: {len(sources)} cached items from {feed_config['name']}"
+                ))
+                return sources
+            response.raise_for_status()
+            
             await self._emit(IngestEvent(
                 source=feed_config["name"],
                 status="parsing",
                 message=f"Parsing feed from {feed_config['name']}..."
             ))
             
-            feed = feedparser.parse(response.text)
+            # Parse off the event loop; bytes let the parser sniff the encoding itself
+            entries = await asyncio.to_thread(parse_feed, response.content, max_items)
             sources = []
             
-            for entry in feed.entries[:10]:
+            for entry in entries:
                 try:
                     source = Source.from_feed_entry(entry, source_name=feed_config["name"])
-                    # Add domain/source metadata manually if needed, generic Source logic does domain parsing
-                    sources.append(source)
                 except Exception as e:
                     continue
+                # Only checked here; ingest_all marks sources seen once they are kept
+                if self.seen is not None and _seen_signature(source) in self.seen:
+                    continue  # Already ingested on an earlier run
+                # Add domain/source metadata manually if needed, generic Source logic does domain parsing
+                sources.append(source)
 
+            if self.feed_cache_path:
+                etag = response.headers.get("etag")
+                last_modified = response.headers.get("last-modified")
+                if etag or last_modified:
+                    self._cond_cache[url] = {
+                        "etag": etag,
+                        "last_modified": last_modified,
+                        "sources": [src.model_dump(mode="json") for src in sources]
+                    }
+                else:
+                    self._cond_cache.pop(url, None)
+                self._cond_dirty = True
+            
             await self._emit(IngestEvent(
                 source=feed_config["name"],
                 status="complete",
@@ -141,11 +284,28 @@ class IngestEngine:
     
     async def ingest_all(self) -> Dict[str, Any]:
         """Fetch from all configured sources and return data + stats."""
-        tasks = [self.fetch_rss(src) for src in RSS_SOURCES]
-        results = await asyncio.gather(*tasks)
+        self._ctx_cache.clear()
+        tasks = [asyncio.create_task(self.fetch_rss(src)) for src in RSS_SOURCES]
+        pending = set()
+        if tasks:
+            _, pending = await asyncio.wait(tasks, timeout=INGEST_TIMEOUT)
+        
+        # Feeds still running at the deadline are cancelled and count as failed
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        for task, src in zip(tasks, RSS_SOURCES):
+            if task in pending:
+                await self._emit(IngestEvent(
+                    source=src["name"],
+                    status="error",
+                    message=f"Timed out fetching {src['name']}"
+                ))
+        results = [[] if task in pending else task.result() for task in tasks]
         
         self.sources = []
-        seen_ids = set()
+        # 64-bit hashes of canonical URLs: small int keys, and the URL strings can be freed
+        seen: Set[int] = set()
         
         total_fetched = 0
         failed_feeds = 0
@@ -160,15 +320,31 @@ class IngestEngine:
             if len(source_list) == 0:
                  pass # Could verify error state if fetch_rss returned it
             
+            # Same article often surfaces in several feeds; keep the first copy
             for s in source_list:
-                if s.id not in seen_ids:
+                key = hash(normalize_url(s.url))
+                if key not in seen:
                     self.sources.append(s)
-                    seen_ids.add(s.id)
+                    seen.add(key)
         
-        # Sort by timestamp
-        self.sources.sort(key=lambda s: s.timestamp, reverse=True)
+        if self._cond_dirty:
+            await asyncio.to_thread(self._save_feed_cache)
+            self._cond_dirty = False
         
         unique_count = len(self.sources)
+        
+        # Newest first. With a cap, select the top K in O(N log K) instead of sorting everything
+        if self.max_sources is not None and self.max_sources < unique_count:
+            self.sources = heapq.nlargest(self.max_sources, self.sources, key=attrgetter("timestamp"))
+        else:
+            self.sources.sort(key=attrgetter("timestamp"), reverse=True)
+        
+        # Mark only what we kept: failed or timed-out feeds get another chance next run
+        if self.seen is not None:
+            for s in self.sources:
+                self.seen.add(_seen_signature(s))
+            await asyncio.to_thread(self.seen.save, self.seen_filter_path)
+        
         failed_count = sum(1 for r in results if len(r) == 0) # Rough proxy for now
         
         stats = {
@@ -188,16 +364,20 @@ class IngestEngine:
     
     def get_context_text(self, max_items: int = 30) -> str:
         """Get concatenated summaries for LLM context."""
+        key = (max_items, tuple(s.id for s in self.sources[:max_items]))
+        cached = self._ctx_cache.get(key)
+        if cached is not None:
+            return cached
+        
         parts = []
         for s in self.sources[:max_items]:
-            # Clean text
-            import re
-            clean_text = re.sub(r'<[^>]+>', '', s.text)
-            # Remove whitespace
-            clean_text = " ".join(clean_text.split())
+            # Strip tags and collapse whitespace
+            clean_text = _WS_RE.sub(" ", _TAG_RE.sub("", s.text)).strip()
             parts.append(f"SOURCE: {s.title}\nURL: {s.url}\nCONTENT: {clean_text[:500]}...")
         
-        return "\n\n---\n\n".join(parts)
+        text = "\n\n---\n\n".join(parts)
+        self._ctx_cache[key] = text
+        return text
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -209,8 +389,8 @@ async def main():
     async def log_event(event: IngestEvent):
         print(f"[{event.status}] {event.source}: {event.message}")
     
-    engine = IngestEngine(event_callback=log_event)
-    result = await engine.ingest_all()
+    async with IngestEngine(event_callback=log_event) as engine:
+        result = await engine.ingest_all()
     articles = result["sources"]
     
     print(f"\n⟡ Total articles: {len(articles)}")
@@ -219,4 +399,8 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        import uvloop
+    except ImportError:
+        uvloop = None
+    (uvloop.run if uvloop else asyncio.run)(main())
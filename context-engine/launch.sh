@@ -10,7 +10,7 @@ echo "⟡ Starting Context Engine..."
 # Check Python dependencies
 if ! python3 -c "import fastapi" 2>/dev/null; then
     echo "Installing dependencies..."
-    pip3 install fastapi uvicorn httpx feedparser pydantic
+    pip3 install fastapi "uvicorn[standard]" httpx feedparser pydantic orjson
 fi
 
 # Run server
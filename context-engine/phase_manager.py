@@ -14,15 +14,30 @@ Valid phases (in order):
 Phase transitions are GATED. If requirements not met, state does not advance.
 """
 
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional, Set
-from enum import Enum
+from itertools import islice
+from typing import Dict, List, Optional, Set, Union
+from enum import StrEnum
 import hashlib
 import json
+import os
 
+# Ring buffer size for PhaseManager's event log
+PHASE_LOG_MAX = int(os.environ.get("PHASE_LOG_MAX", "1024"))
 
-class Phase(Enum):
+
+def _fp(output: Union[str, bytes]) -> str:
+    """16-hex-char fingerprint of an agent output (integrity marker, not a security hash).
+    
+    Pass bytes when the caller already has the encoded output, to skip a UTF-8 pass.
+    """
+    data = output.encode("utf-8") if isinstance(output, str) else output
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+class Phase(StrEnum):
     IDLE = "idle"
     INGESTING = "ingesting"
     DELIBERATING = "deliberating"
@@ -40,36 +55,34 @@ class AgentExecution:
     output_hash: str
     
     @classmethod
-    def create(cls, agent_id: str, role: str, provider: str, output: str) -> "AgentExecution":
+    def create(cls, agent_id: str, role: str, provider: str, output: Union[str, bytes]) -> "AgentExecution":
         return cls(
             agent_id=agent_id,
             role=role,
             provider=provider,
             timestamp=datetime.utcnow().isoformat() + "Z",
-            output_hash=hashlib.sha256(output.encode()).hexdigest()[:16]
+            output_hash=_fp(output)
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PhaseRequirements:
-    """Hard requirements for each phase."""
+    """Hard requirements for each phase.
+    
+    The verdict is cached; change fields through mark_*() / apply_gate() so it stays current.
+    """
     agents_required: int = 0
     agents_completed: int = 0
     arbiter_required: bool = False
     arbiter_ready: bool = False
     ledger_commit_required: bool = False
     ledger_committed: bool = False
+    _missing: List[str] = field(default_factory=list, init=False, repr=False, compare=False)
     
-    def met(self) -> bool:
-        if self.agents_required > 0 and self.agents_completed < self.agents_required:
-            return False
-        if self.arbiter_required and not self.arbiter_ready:
-            return False
-        if self.ledger_commit_required and not self.ledger_committed:
-            return False
-        return True
+    def __post_init__(self):
+        self._refresh()
     
-    def missing(self) -> List[str]:
+    def _refresh(self) -> None:
         issues = []
         if self.agents_required > 0 and self.agents_completed < self.agents_required:
             issues.append(f"agents: {self.agents_completed}/{self.agents_required}")
@@ -77,7 +90,31 @@ class PhaseRequirements:
             issues.append("arbiter_output_missing")
         if self.ledger_commit_required and not self.ledger_committed:
             issues.append("ledger_commit_pending")
-        return issues
+        self._missing = issues
+    
+    def met(self) -> bool:
+        return not self._missing
+    
+    def missing(self) -> List[str]:
+        return list(self._missing)
+    
+    def mark_agent_completed(self, count: int) -> None:
+        self.agents_completed = count
+        self._refresh()
+    
+    def mark_arbiter(self) -> None:
+        self.arbiter_ready = True
+        self._refresh()
+    
+    def mark_ledger(self) -> None:
+        self.ledger_committed = True
+        self._refresh()
+    
+    def apply_gate(self, gate: Dict) -> None:
+        """Raise the bar for a target phase (see PhaseManager.GATES)."""
+        for name, value in gate.items():
+            setattr(self, name, value)
+        self._refresh()
 
 
 @dataclass
@@ -134,12 +171,19 @@ class PhaseManager:
     
     def __init__(self):
         self.state = EngineState()
-        self._event_log: List[Dict] = []
+        self._event_log: deque = deque(maxlen=PHASE_LOG_MAX)
+        self.version = 0  # Bumped on every state change; lets callers cache get_state() renderings
     
     def get_state(self) -> Dict:
         """Get current state for API response."""
         return self.state.to_dict()
     
+    def get_recent_events(self, n: int) -> List[Dict]:
+        """Last n logged events, oldest first, without copying the whole log."""
+        recent = list(islice(reversed(self._event_log), max(0, n)))
+        recent.reverse()
+        return recent
+    
     def log_event(self, event_type: str, data: Dict) -> None:
         """Log an event that may trigger state change."""
         event = {
@@ -149,22 +193,23 @@ class PhaseManager:
         }
         self._event_log.append(event)
         self.state.last_event = event_type
+        self.version += 1
     
-    def record_agent_execution(self, agent_id: str, role: str, provider: str, output: str) -> None:
+    def record_agent_execution(self, agent_id: str, role: str, provider: str, output: Union[str, bytes]) -> None:
         """Record that an agent has completed execution."""
         execution = AgentExecution.create(agent_id, role, provider, output)
         self.state.agent_executions.append(execution)
-        self.state.requirements.agents_completed = len(self.state.agent_executions)
+        self.state.requirements.mark_agent_completed(len(self.state.agent_executions))
         self.log_event("agent_completed", {"agent_id": agent_id, "role": role})
     
-    def record_arbiter_output(self, output: str) -> None:
+    def record_arbiter_output(self, output: Union[str, bytes]) -> None:
         """Record arbiter completion."""
-        self.state.requirements.arbiter_ready = True
-        self.log_event("arbiter_completed", {"output_hash": hashlib.sha256(output.encode()).hexdigest()[:16]})
+        self.state.requirements.mark_arbiter()
+        self.log_event("arbiter_completed", {"output_hash": _fp(output)})
     
     def record_ledger_commit(self, entry_id: str) -> None:
         """Record ledger commit."""
-        self.state.requirements.ledger_committed = True
+        self.state.requirements.mark_ledger()
         self.log_event("ledger_committed", {"entry_id": entry_id})
     
     def start_session(self, session_id: str) -> None:
@@ -188,6 +233,7 @@ class PhaseManager:
             self.state.phase = Phase.IDLE
             self.state.since = datetime.utcnow().isoformat() + "Z"
             self.state.blocked_reason = None
+            self.version += 1
             return True
         
         # Always allow ingesting from idle
@@ -195,18 +241,14 @@ class PhaseManager:
             self.state.phase = Phase.INGESTING
             self.state.since = datetime.utcnow().isoformat() + "Z"
             self.state.blocked_reason = None
+            self.version += 1
             return True
         
         # Check gates for other transitions
         gate = self.GATES.get(target, {})
         
         # Update requirements based on gate
-        if "agents_required" in gate:
-            self.state.requirements.agents_required = gate["agents_required"]
-        if "arbiter_required" in gate:
-            self.state.requirements.arbiter_required = gate["arbiter_required"]
-        if "ledger_commit_required" in gate:
-            self.state.requirements.ledger_commit_required = gate["ledger_commit_required"]
+        self.state.requirements.apply_gate(gate)
         
         # Check if requirements met
         if not self.state.requirements.met():
@@ -225,7 +267,8 @@ class PhaseManager:
     def reset(self) -> None:
         """Reset to idle state."""
         self.state = EngineState()
-        self._event_log = []
+        self._event_log.clear()
+        self.version += 1
 
 
 # Singleton instance — THE authority
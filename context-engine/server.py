@@ -10,22 +10,25 @@ Endpoints:
 """
 
 import asyncio
-import json
-from datetime import datetime
+import functools
+import orjson
+import re
+import time
+from datetime import datetime, timezone
 from pathlib import Path
 from contextlib import asynccontextmanager
-from typing import Optional, List
-from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Optional, List, Set, Tuple, Union
 
 from fastapi import FastAPI, BackgroundTasks, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse, JSONResponse, FileResponse
+from fastapi.responses import JSONResponse, FileResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 
 from data_schema import PortalData, Meta, LivingMind, LiveEvent
 from ingest import IngestEngine, IngestEvent
 from council import CouncilEngine, CouncilEvent
-from deliberation import DeliberationEngine, DeliberationSession
+from deliberation import DeliberationSession, get_deliberation_engine
 from agents import get_agent_status, get_available_agents, AgentRole
 from phase_manager import get_phase_manager, Phase
 
@@ -36,25 +39,57 @@ from phase_manager import get_phase_manager, Phase
 DATA_PATH = Path(__file__).parent.parent / "public" / "data.json"
 ARTIFACTS_DIR = Path(__file__).parent / "artifacts"
 SESSIONS_DIR = Path(__file__).parent / "sessions"
+SESSION_INDEX = SESSIONS_DIR / "index.jsonl"  # One summary line per session, oldest first
 STATIC_DIR = Path(__file__).parent.parent  # Root of project for index.html, main.js, index.css
 
+class RingLog:
+    """Fixed-size ring buffer of recent events; tail() reads only what it returns."""
+    
+    def __init__(self, capacity: int = 128):
+        assert capacity & (capacity - 1) == 0, "capacity must be a power of two"
+        self._buf: List[Optional[dict]] = [None] * capacity
+        self._mask = capacity - 1
+        self._head = 0  # Total appends; next write goes to _head & _mask
+        self._size = 0
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def append(self, item: dict) -> None:
+        self._buf[self._head & self._mask] = item
+        self._head += 1
+        if self._size <= self._mask:
+            self._size += 1
+    
+    def tail(self, limit: int) -> List[dict]:
+        """Up to `limit` most recent items, oldest first."""
+        n = min(max(limit, 0), self._size)
+        head, buf, mask = self._head, self._buf, self._mask
+        return [buf[i & mask] for i in range(head - n, head)]
+
 # Global state
-EVENT_QUEUE = asyncio.Queue()
-ACTIVITY_LOG = deque(maxlen=100)  # Last 100 events
-
-# Legacy ENGINE_STATE kept for compatibility, but phase is now gated
-ENGINE_STATE = {
-    "phase": "idle",  # Read from PhaseManager
-    "last_activity": None,
-    "active_models": [],
-    "sessions_today": 0,
-    "sources_ingested": 0
-}
+SUBSCRIBERS: Set[asyncio.Queue] = set()  # One bounded queue of SSE frames per /api/live client
+SUBSCRIBER_QUEUE_SIZE = 256
+SSE_PING_SECONDS = 15  # Heartbeat interval on /api/live
+ACTIVITY_LOG = RingLog(128)  # Last 128 events
+
+@dataclass(slots=True)
+class ServerState:
+    """Server-side counters and the mirrored phase (phase_manager.EngineState is the authority)."""
+    phase: str = "idle"  # Read from PhaseManager
+    last_activity: Optional[str] = None
+    active_models: List[dict] = field(default_factory=list)
+    sessions_today: int = 0
+    sources_ingested: int = 0
+
+# Legacy server state kept for compatibility, but phase is now gated
+STATE = ServerState()
 
 def sync_phase_from_manager():
-    """Sync ENGINE_STATE phase from PhaseManager (single source of truth)."""
+    """Sync STATE.phase from PhaseManager (single source of truth)."""
     pm = get_phase_manager()
-    ENGINE_STATE["phase"] = pm.state.phase.value
+    STATE.phase = pm.state.phase.value
+    invalidate_status()
 
 # ═══════════════════════════════════════════════════════════════
 # LIFESPAN
@@ -67,17 +102,29 @@ async def lifespan(app: FastAPI):
     SESSIONS_DIR.mkdir(exist_ok=True)
     
     # Initialize deliberation engine to check available models
-    engine = DeliberationEngine()
-    ENGINE_STATE["active_models"] = engine.get_available_models()
+    engine = get_deliberation_engine()
+    STATE.active_models = engine.get_available_models()
+    invalidate_status()
+    start_heartbeat()
     
     yield
     print("⟡ Truth Engine shutting down...")
+    stop_heartbeat()
+    await engine.aclose()
+
+
+class OrjsonResponse(JSONResponse):
+    """JSONResponse encoded with orjson (fastapi.responses.ORJSONResponse is deprecated)."""
+    
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS, default=str)
 
 
 app = FastAPI(
     title="Mirror Intelligence — Truth Engine",
     version="4.0",
     description="Multi-model deliberation with live streaming",
+    default_response_class=OrjsonResponse,
     lifespan=lifespan
 )
 
@@ -93,12 +140,94 @@ app.add_middleware(
 # EVENT SYSTEM
 # ═══════════════════════════════════════════════════════════════
 
+def sse_frame(event: Union[dict, List[dict]]) -> bytes:
+    """Encode an event (or a batch of events) as a Server-Sent Events data frame."""
+    return b"data: " + orjson.dumps(event, default=str) + b"\n\n"
+
+@functools.lru_cache(maxsize=None)
+def heartbeat_frame(phase: str) -> bytes:
+    """Heartbeat frames only vary by phase, so build each one once."""
+    return sse_frame({"type": "heartbeat", "phase": phase})
+
+# Events arriving within this window go out as one frame (a JSON array if >1)
+BROADCAST_BATCH_SECONDS = 0.02
+FLUSH_NOW_EVENTS = {"phase_change", "pipeline_complete"}
+_pending_events: List[dict] = []
+_flush_handle: Optional[asyncio.TimerHandle] = None
+
+def _flush_events() -> None:
+    """Send pending events to every subscriber as a single frame."""
+    global _flush_handle
+    if _flush_handle is not None:
+        _flush_handle.cancel()
+        _flush_handle = None
+    if not _pending_events:
+        return
+    batch = _pending_events[0] if len(_pending_events) == 1 else list(_pending_events)
+    _pending_events.clear()
+    # Encode once; every subscriber gets the same frame
+    _fanout(sse_frame(batch))
+
+def _fanout(frame: bytes) -> None:
+    """Enqueue one encoded frame for every /api/live subscriber."""
+    for q in SUBSCRIBERS:
+        try:
+            q.put_nowait(frame)
+        except asyncio.QueueFull:
+            # Slow client: drop its oldest frame rather than stall the pipeline
+            q.get_nowait()
+            q.put_nowait(frame)
+
+_heartbeat_handle: Optional[asyncio.TimerHandle] = None
+
+def _heartbeat_tick() -> None:
+    """Keep /api/live connections alive and re-sync each client's phase display.
+    
+    One timer serves every subscriber; heartbeats skip the activity log and batching.
+    """
+    global _heartbeat_handle
+    if SUBSCRIBERS:
+        _fanout(heartbeat_frame(STATE.phase))
+    _heartbeat_handle = asyncio.get_running_loop().call_later(SSE_PING_SECONDS, _heartbeat_tick)
+
+def start_heartbeat() -> None:
+    global _heartbeat_handle
+    if _heartbeat_handle is None:
+        _heartbeat_handle = asyncio.get_running_loop().call_later(SSE_PING_SECONDS, _heartbeat_tick)
+
+def stop_heartbeat() -> None:
+    global _heartbeat_handle
+    if _heartbeat_handle is not None:
+        _heartbeat_handle.cancel()
+        _heartbeat_handle = None
+
+_now_ms = -1
+_now_str = ""
+
+def now_iso() -> str:
+    """UTC ISO-8601 timestamp at millisecond resolution, formatted at most once per ms."""
+    global _now_ms, _now_str
+    ms = time.time_ns() // 1_000_000
+    if ms != _now_ms:
+        _now_ms = ms
+        dt = datetime.fromtimestamp(ms // 1000, tz=timezone.utc).replace(microsecond=ms % 1000 * 1000)
+        _now_str = dt.isoformat(timespec="milliseconds")[:-6] + "Z"
+    return _now_str
+
 async def broadcast_event(event: dict):
     """Broadcast event to all listeners and log."""
-    event["timestamp"] = datetime.utcnow().isoformat() + "Z"
+    global _flush_handle
+    event["timestamp"] = now_iso()
     ACTIVITY_LOG.append(event)
-    ENGINE_STATE["last_activity"] = event["timestamp"]
-    await EVENT_QUEUE.put(event)
+    STATE.last_activity = event["timestamp"]
+    invalidate_status()
+    if not SUBSCRIBERS:
+        return
+    _pending_events.append(event)
+    if event.get("type") in FLUSH_NOW_EVENTS:
+        _flush_events()  # Phase changes shouldn't wait; flushes earlier events first
+    elif _flush_handle is None:
+        _flush_handle = asyncio.get_running_loop().call_later(BROADCAST_BATCH_SECONDS, _flush_events)
 
 async def emit_live_event(event_type: str, message: str, **kwargs):
     """Helper to emit standard live events."""
@@ -129,6 +258,65 @@ async def deliberation_adapter(event: dict):
     """Adapter for deliberation engine events."""
     await broadcast_event(event)
 
+# ═══════════════════════════════════════════════════════════════
+# SESSION INDEX
+# ═══════════════════════════════════════════════════════════════
+
+def _session_summary(doc: dict) -> dict:
+    return {
+        "session_id": doc["session_id"],
+        "topic": doc["topic"],
+        "started_at": doc["started_at"],
+        "models": len(doc.get("initial_takes", []))
+    }
+
+def rebuild_session_index() -> None:
+    """Regenerate index.jsonl from the session files (first run, or after manual edits)."""
+    lines = []
+    for f in sorted(SESSIONS_DIR.glob("session_*.json")):
+        try:
+            lines.append(orjson.dumps(_session_summary(orjson.loads(f.read_bytes()))) + b"\n")
+        except:
+            pass
+    tmp = SESSION_INDEX.with_suffix(".tmp")
+    tmp.write_bytes(b"".join(lines))
+    tmp.replace(SESSION_INDEX)
+
+def save_session(session_file: Path, session_doc: dict) -> None:
+    """Write a session file and add it to the index."""
+    session_file.write_bytes(orjson.dumps(session_doc, option=orjson.OPT_INDENT_2, default=str))
+    if not SESSION_INDEX.exists():
+        rebuild_session_index()  # Picks up the file we just wrote
+        return
+    with open(SESSION_INDEX, "ab") as f:
+        f.write(orjson.dumps(_session_summary(session_doc), default=str) + b"\n")
+
+def read_session_index(limit: int) -> List[dict]:
+    """Last `limit` index entries, newest first, reading only the end of the file."""
+    if limit <= 0:
+        return []
+    if not SESSION_INDEX.exists():
+        rebuild_session_index()
+    with open(SESSION_INDEX, "rb") as f:
+        size = f.seek(0, 2)
+        chunk = 256 * limit
+        while True:
+            start = max(0, size - chunk)
+            f.seek(start)
+            lines = f.read().splitlines()
+            if start > 0:
+                lines = lines[1:]  # Probably cut mid-line
+            if len(lines) >= limit or start == 0:
+                break
+            chunk *= 4
+    entries = []
+    for line in reversed(lines[-limit:]):
+        try:
+            entries.append(orjson.loads(line))
+        except orjson.JSONDecodeError:
+            pass
+    return entries
+
 # ═══════════════════════════════════════════════════════════════
 # CORE PIPELINE
 # ═══════════════════════════════════════════════════════════════
@@ -148,10 +336,11 @@ async def run_full_pipeline() -> PortalData:
     await emit_live_event("phase_change", "Starting ingestion...", phase="ingesting")
     
     # 1. INGEST
-    ingest = IngestEngine(event_callback=ingest_adapter)
-    ingest_result = await ingest.ingest_all()
+    async with IngestEngine(event_callback=ingest_adapter) as ingest:
+        ingest_result = await ingest.ingest_all()
     sources = ingest_result["sources"]
-    ENGINE_STATE["sources_ingested"] = len(sources)
+    STATE.sources_ingested = len(sources)
+    invalidate_status()
     
     context = ingest.get_context_text(max_items=20)
     
@@ -181,7 +370,8 @@ async def run_full_pipeline() -> PortalData:
         await emit_live_event("phase_blocked", f"Deliberation blocked: {pm.state.blocked_reason}")
     
     # Also run the multi-model deliberation engine
-    delib_engine = DeliberationEngine(event_callback=deliberation_adapter)
+    delib_engine = get_deliberation_engine()
+    delib_engine.event_callback = deliberation_adapter
     session = await delib_engine.deliberate(
         topic=f"Daily Intelligence - {datetime.now().strftime('%Y-%m-%d')}",
         context=context
@@ -189,49 +379,18 @@ async def run_full_pipeline() -> PortalData:
     
     # Save session
     session_file = SESSIONS_DIR / f"session_{session.session_id}.json"
-    with open(session_file, "w") as f:
-        json.dump({
-            "session_id": session.session_id,
-            "topic": session.topic,
-            "phase": session.phase,
-            "started_at": session.started_at,
-            "completed_at": session.completed_at,
-            "initial_takes": [
-                {
-                    "model_id": t.model_id,
-                    "model_name": t.model_name,
-                    "take": t.take,
-                    "confidence": t.confidence,
-                    "key_risks": t.key_risks,
-                    "latency_ms": t.latency_ms
-                }
-                for t in session.initial_takes
-            ],
-            "responses": [
-                {
-                    "model_id": r.model_id,
-                    "responding_to": r.responding_to,
-                    "agreement_level": r.agreement_level,
-                    "response": r.response,
-                    "updated_confidence": r.updated_confidence
-                }
-                for r in session.responses
-            ],
-            "synthesis": {
-                "consensus": session.synthesis.consensus,
-                "disagreements": session.synthesis.disagreements,
-                "confidence_shifts": session.synthesis.confidence_shifts,
-                "open_questions": session.synthesis.open_questions,
-                "final_probability": session.synthesis.final_probability
-            } if session.synthesis else None,
-            "events": session.events
-        }, f, indent=2, default=str)
-    
-    ENGINE_STATE["sessions_today"] += 1
+    # orjson encodes the nested takes/responses/synthesis dataclasses natively;
+    # the ingest context is already in data.json, so leave it out
+    session_doc = dict(vars(session))
+    del session_doc["context"]
+    await asyncio.to_thread(save_session, session_file, session_doc)
+    
+    STATE.sessions_today += 1
+    invalidate_status()
     
     # Record arbiter output (synthesis is the arbiter's work)
     if session.synthesis:
-        arbiter_output = json.dumps({
+        arbiter_output = orjson.dumps({
             "consensus": session.synthesis.consensus,
             "disagreements": session.synthesis.disagreements,
             "final_probability": session.synthesis.final_probability
@@ -249,7 +408,7 @@ async def run_full_pipeline() -> PortalData:
     prev_mind = None
     if DATA_PATH.exists():
         try:
-            prev_data = PortalData.from_json_file(str(DATA_PATH))
+            prev_data = await asyncio.to_thread(PortalData.from_json_file, str(DATA_PATH))
             prev_mind = prev_data.mind
         except:
             pass
@@ -301,7 +460,8 @@ async def run_full_pipeline() -> PortalData:
         meta=Meta(date=datetime.now().strftime("%A, %B %d, %Y"), version="4.0-truth-engine"),
         mind=mind
     )
-    data.to_json_file(str(DATA_PATH))
+    await asyncio.to_thread(data.to_json_file, str(DATA_PATH))
+    invalidate_portal()
     
     await emit_live_event("pipeline_complete", "Truth Engine cycle complete", 
                           sources=len(sources),
@@ -314,6 +474,110 @@ async def run_full_pipeline() -> PortalData:
     
     return data
 
+# ═══════════════════════════════════════════════════════════════
+# DATA CACHE
+# ═══════════════════════════════════════════════════════════════
+
+# Words of 4+ chars; shorter keywords are too common to link a pulse to a source
+_WORD_RE = re.compile(r"\w{4,}")
+PULSE_SOURCE_SCAN = 50  # Newest sources searched for pulse citations
+
+@dataclass
+class PortalCache:
+    """Parsed data.json plus lookups derived from it, built at most once per file version."""
+    mtime_ns: int
+    data: PortalData
+    
+    @functools.cached_property
+    def word_index(self) -> Dict[str, List[int]]:
+        """Lowercased word (title + text) -> ascending indices of the scanned sources using it."""
+        index: Dict[str, List[int]] = {}
+        for i, s in enumerate(self.data.mind.sources[:PULSE_SOURCE_SCAN]):
+            for word in set(_WORD_RE.findall(f"{s.title} {s.text}".lower())):
+                index.setdefault(word, []).append(i)
+        return index
+    
+    @functools.cached_property
+    def source_cards(self) -> List[dict]:
+        """/api/sources rows, parallel to mind.sources."""
+        return [
+            {
+                "id": s.id,
+                "title": s.title,
+                "url": s.url,
+                "domain": s.domain,
+                "excerpt": s.text[:200] + "..."
+            }
+            for s in self.data.mind.sources
+        ]
+    
+    @functools.cached_property
+    def source_domains(self) -> List[str]:
+        """Lowercased domain per source, parallel to mind.sources."""
+        return [s.domain.lower() for s in self.data.mind.sources]
+    
+    @functools.cached_property
+    def forecast_details(self) -> Dict[str, dict]:
+        """/api/forecast/{id} bodies by forecast id (first wins on duplicates)."""
+        details: Dict[str, dict] = {}
+        for f in self.data.mind.forecasts:
+            details.setdefault(f.id, {
+                "id": f.id,
+                "question": f.question,
+                "probability": f.probability,
+                "probability_pct": f"{f.probability * 100:.0f}%",
+                "resolution_date": f.resolution_date.isoformat(),
+                "resolution_criteria": f.resolution_criteria,
+                "status": f.status,
+                "outcome": f.outcome,
+                "brier_score": f.brier_score,
+                "created_at": f.created_at.isoformat()
+            })
+        return details
+    
+    @functools.cached_property
+    def ledger_rows(self) -> List[dict]:
+        """/api/ledger rows, parallel to mind.ledger."""
+        return [
+            {
+                "id": e.id,
+                "timestamp": e.timestamp.isoformat(),
+                "type": e.type,
+                "payload": e.payload,
+                "prev_hash": e.prev_hash
+            }
+            for e in self.data.mind.ledger
+        ]
+
+_DATA_CACHE: Optional[PortalCache] = None
+
+def portal_cache() -> Optional[PortalCache]:
+    """Cache entry for data.json, re-read only when its mtime changes.
+    
+    One stat() per call answers both "is there data?" and "has it changed?";
+    returns None if there is no data yet.
+    """
+    global _DATA_CACHE
+    try:
+        mtime = DATA_PATH.stat().st_mtime_ns
+    except FileNotFoundError:
+        _DATA_CACHE = None
+        return None
+    if _DATA_CACHE is None or _DATA_CACHE.mtime_ns != mtime:
+        data = PortalData.model_validate(orjson.loads(DATA_PATH.read_bytes()))
+        _DATA_CACHE = PortalCache(mtime, data)
+    return _DATA_CACHE
+
+def load_portal() -> Optional[PortalData]:
+    """Parsed data.json, or None (see portal_cache). Shared object; treat it as read-only."""
+    cache = portal_cache()
+    return cache.data if cache is not None else None
+
+def invalidate_portal() -> None:
+    """Forget the cached data.json; call after writing it."""
+    global _DATA_CACHE
+    _DATA_CACHE = None
+
 # ═══════════════════════════════════════════════════════════════
 # API ENDPOINTS
 # ═══════════════════════════════════════════════════════════════
@@ -332,7 +596,7 @@ async def serve_index():
     return {
         "name": "Mirror Intelligence — Truth Engine",
         "version": "4.0",
-        "status": ENGINE_STATE["phase"],
+        "status": STATE.phase,
         "note": "No index.html found. Run frontend build or use Vite dev server."
     }
 
@@ -388,7 +652,7 @@ def api_info():
     return {
         "name": "Mirror Intelligence — Truth Engine",
         "version": "4.0",
-        "status": ENGINE_STATE["phase"],
+        "status": STATE.phase,
         "endpoints": {
             "live_stream": "/api/live",
             "status": "/api/status",
@@ -403,13 +667,29 @@ def api_info():
         }
     }
 
+# (PhaseManager.version, body) of the last idle /api/status; see invalidate_status()
+_STATUS_CACHE: Optional[Tuple[int, bytes]] = None
+
+def invalidate_status() -> None:
+    """Call after changing anything /api/status reports outside the PhaseManager."""
+    global _STATUS_CACHE
+    _STATUS_CACHE = None
+
 @app.get("/api/status")
-def get_status():
-    """Real-time engine status — authoritative state from PhaseManager."""
+async def get_status():
+    """Real-time engine status — authoritative state from PhaseManager.
+    
+    async so the body is built and cached on the loop thread, where every
+    version bump and invalidate_status() happens; from the threadpool a stale
+    body could be stored under a newer version.
+    """
+    global _STATUS_CACHE
     pm = get_phase_manager()
-    state = pm.get_state()  # Single source of truth
+    if _STATUS_CACHE is not None and _STATUS_CACHE[0] == pm.version:
+        return Response(content=_STATUS_CACHE[1], media_type="application/json")
     
-    return {
+    state = pm.get_state()  # Single source of truth
+    body = orjson.dumps({
         # Authoritative phase state
         "phase": state["phase"],
         "phase_since": state["since"],
@@ -419,14 +699,18 @@ def get_status():
         "last_event": state["last_event"],
         
         # Legacy fields for compatibility
-        "last_activity": ENGINE_STATE["last_activity"],
-        "active_models": ENGINE_STATE["active_models"],
+        "last_activity": STATE.last_activity,
+        "active_models": STATE.active_models,
         "agents": get_agent_status(),
         "agents_available": len(get_available_agents()),
-        "sessions_today": ENGINE_STATE["sessions_today"],
-        "sources_ingested": ENGINE_STATE["sources_ingested"],
-        "recent_events": list(ACTIVITY_LOG)[-10:]
-    }
+        "sessions_today": STATE.sessions_today,
+        "sources_ingested": STATE.sources_ingested,
+        "recent_events": ACTIVITY_LOG.tail(10)
+    }, default=str)
+    # Only cache the idle steady state the frontend keeps polling
+    if state["phase"] == "idle" and STATE.phase == "idle":
+        _STATUS_CACHE = (pm.version, body)
+    return Response(content=body, media_type="application/json")
 
 @app.get("/api/agents")
 def get_agents():
@@ -437,37 +721,42 @@ def get_agents():
         "agents": get_agent_status()
     }
 
+SSE_HEADERS = {"Cache-Control": "no-store", "X-Accel-Buffering": "no"}  # Don't let proxies buffer the stream
+
 @app.get("/api/live")
 async def live_stream():
     """Server-Sent Events stream for real-time updates."""
     async def generator():
-        # Send initial status
-        yield f"data: {json.dumps({'type': 'connected', 'message': 'Connected to Truth Engine', 'phase': ENGINE_STATE['phase']})}\n\n"
-        
-        while True:
-            try:
-                event = await asyncio.wait_for(EVENT_QUEUE.get(), timeout=5.0)
-                yield f"data: {json.dumps(event, default=str)}\n\n"
-            except asyncio.TimeoutError:
-                # Send heartbeat with current phase
-                yield f"data: {json.dumps({'type': 'heartbeat', 'phase': ENGINE_STATE['phase']})}\n\n"
-
-    return StreamingResponse(generator(), media_type="text/event-stream")
+        # The queue is created and drained on this response's task; broadcast_event
+        # only ever put_nowait()s into it from the same loop
+        q = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        SUBSCRIBERS.add(q)
+        try:
+            # Send initial status
+            yield sse_frame({"type": "connected", "message": "Connected to Truth Engine", "phase": STATE.phase})
+            
+            while True:
+                yield await q.get()  # Pre-encoded frame bytes pass through unchanged
+        finally:
+            SUBSCRIBERS.discard(q)
+
+    # Frames are pre-encoded and heartbeats come from the shared timer (start_heartbeat),
+    # so a plain stream is all SSE needs; no per-connection ping task
+    return StreamingResponse(generator(), media_type="text/event-stream", headers=SSE_HEADERS)
 
 @app.get("/api/activity")
 def get_activity(limit: int = 50):
     """Get recent activity log."""
-    events = list(ACTIVITY_LOG)
     return {
-        "count": len(events),
-        "events": events[-limit:]
+        "count": len(ACTIVITY_LOG),
+        "events": ACTIVITY_LOG.tail(limit)
     }
 
 @app.post("/api/refresh")
 async def refresh(bg: BackgroundTasks):
     """Trigger full pipeline."""
-    if ENGINE_STATE["phase"] != "idle":
-        return {"status": "busy", "current_phase": ENGINE_STATE["phase"]}
+    if STATE.phase != "idle":
+        return {"status": "busy", "current_phase": STATE.phase}
     
     bg.add_task(run_full_pipeline)
     return {"status": "started", "message": "Full pipeline initiated"}
@@ -475,28 +764,31 @@ async def refresh(bg: BackgroundTasks):
 @app.post("/api/deliberate")
 async def deliberate_only(bg: BackgroundTasks, topic: str = "Ad-hoc deliberation"):
     """Trigger deliberation without ingestion."""
-    if ENGINE_STATE["phase"] != "idle":
-        return {"status": "busy", "current_phase": ENGINE_STATE["phase"]}
+    if STATE.phase != "idle":
+        return {"status": "busy", "current_phase": STATE.phase}
     
     async def run_deliberation():
-        ENGINE_STATE["phase"] = "deliberating"
+        STATE.phase = "deliberating"
+        invalidate_status()
         
         # Get context from existing data
         context = ""
-        if DATA_PATH.exists():
-            try:
-                data = PortalData.from_json_file(str(DATA_PATH))
+        try:
+            data = await asyncio.to_thread(load_portal)
+            if data is not None:
                 context = "\n".join([f"{s.title}: {s.text[:200]}" for s in data.mind.sources[:10]])
-            except:
-                pass
+        except:
+            pass
         
         if not context:
             context = "No recent context available."
         
-        engine = DeliberationEngine(event_callback=deliberation_adapter)
+        engine = get_deliberation_engine()
+        engine.event_callback = deliberation_adapter
         await engine.deliberate(topic, context)
         
-        ENGINE_STATE["phase"] = "idle"
+        STATE.phase = "idle"
+        invalidate_status()
     
     bg.add_task(run_deliberation)
     return {"status": "started", "topic": topic}
@@ -504,30 +796,19 @@ async def deliberate_only(bg: BackgroundTasks, topic: str = "Ad-hoc deliberation
 @app.get("/api/sessions")
 def list_sessions(limit: int = 10):
     """List recent deliberation sessions."""
-    sessions = []
-    for f in sorted(SESSIONS_DIR.glob("session_*.json"), reverse=True)[:limit]:
-        try:
-            with open(f) as file:
-                data = json.load(file)
-                sessions.append({
-                    "session_id": data["session_id"],
-                    "topic": data["topic"],
-                    "started_at": data["started_at"],
-                    "models": len(data.get("initial_takes", []))
-                })
-        except:
-            pass
-    return {"sessions": sessions}
+    return {"sessions": read_session_index(limit)}
 
 @app.get("/api/session/{session_id}")
 def get_session(session_id: str):
     """Get full deliberation session."""
     session_file = SESSIONS_DIR / f"session_{session_id}.json"
-    if not session_file.exists():
+    try:
+        body = session_file.read_bytes()
+    except FileNotFoundError:
         raise HTTPException(404, f"Session {session_id} not found")
     
-    with open(session_file) as f:
-        return json.load(f)
+    # Already JSON on disk; serve the bytes as-is
+    return Response(content=body, media_type="application/json")
 
 @app.get("/api/how-it-works")
 def how_it_works():
@@ -557,7 +838,7 @@ def how_it_works():
                 "duration": "~30 seconds"
             }
         ],
-        "models": ENGINE_STATE["active_models"],
+        "models": STATE.active_models,
         "why_multiple_models": [
             "Single models have blind spots and biases",
             "Disagreement reveals uncertainty more honestly than false confidence",
@@ -580,39 +861,60 @@ def how_it_works():
         }
     }
 
+# (PortalData, serialized body) of the last briefing served
+_BRIEFING_CACHE: Optional[Tuple[PortalData, bytes]] = None
+
 @app.get("/api/briefing")
 def get_briefing():
     """Returns complete Living Mind state."""
-    if DATA_PATH.exists():
-        try:
-            return PortalData.from_json_file(str(DATA_PATH)).model_dump()
-        except Exception as e:
-            return JSONResponse(500, {"error": str(e)})
-    return JSONResponse(404, {"error": "No mind state found. Run /api/refresh first."})
+    global _BRIEFING_CACHE
+    try:
+        data = load_portal()
+    except Exception as e:
+        return JSONResponse({"error": str(e)}, status_code=500)
+    if data is None:
+        return JSONResponse({"error": "No mind state found. Run /api/refresh first."}, status_code=404)
+    
+    if _BRIEFING_CACHE is None or _BRIEFING_CACHE[0] is not data:
+        _BRIEFING_CACHE = (data, orjson.dumps(data.model_dump(), default=str))
+    return Response(content=_BRIEFING_CACHE[1], media_type="application/json")
 
 @app.get("/api/health")
 def health_check():
     """Component health status."""
     return {
-        "overall": "OK" if ENGINE_STATE["phase"] in ["idle", "complete"] else "BUSY",
-        "phase": ENGINE_STATE["phase"],
+        "overall": "OK" if STATE.phase in ["idle", "complete"] else "BUSY",
+        "phase": STATE.phase,
         "components": {
             "ingestion": "OK",
-            "deliberation": "OK" if ENGINE_STATE["active_models"] else "DEGRADED",
+            "deliberation": "OK" if STATE.active_models else "DEGRADED",
             "forecasts": "OK",
             "ledger": "OK"
         },
-        "models_available": len(ENGINE_STATE["active_models"])
+        "models_available": len(STATE.active_models)
     }
 
+def stream_json_list(head: dict, key: str, items: Iterable) -> StreamingResponse:
+    """Respond with {**head, key: [*items]}, encoding and sending one item at a time."""
+    async def body():
+        yield orjson.dumps(head)[:-1] + b',"' + key.encode() + b'":['
+        sep = b""
+        for item in items:
+            yield sep + orjson.dumps(item, default=str)
+            sep = b","
+        yield b"]}"
+    
+    return StreamingResponse(body(), media_type="application/json")
+
 # Drill-down endpoints (kept from v3)
 @app.get("/api/pulse/{delta_index}")
 def get_pulse_detail(delta_index: int):
     """Evidence for pulse item."""
-    if not DATA_PATH.exists():
+    cache = portal_cache()
+    if cache is None:
         raise HTTPException(404, "No data")
     
-    data = PortalData.from_json_file(str(DATA_PATH))
+    data = cache.data
     deltas = data.mind.deltas or []
     
     if delta_index < 0 or delta_index >= len(deltas):
@@ -620,20 +922,21 @@ def get_pulse_detail(delta_index: int):
     
     delta = deltas[delta_index]
     
-    # Find related sources
-    keywords = delta.text.lower().split()[:5]
+    # Find related sources: the first 7 containing any of the delta's first 5 words
+    keywords = set(_WORD_RE.findall(" ".join(delta.text.lower().split()[:5])))
+    hits = set()
+    for kw in keywords:
+        hits.update(cache.word_index.get(kw, ()))
     related = []
-    for src in (data.mind.sources or [])[:50]:
-        if any(kw in (src.title + " " + src.text).lower() for kw in keywords if len(kw) > 3):
-            related.append({
-                "id": src.id,
-                "title": src.title,
-                "url": src.url,
-                "domain": src.domain,
-                "excerpt": src.text[:300] + "..."
-            })
-            if len(related) >= 7:
-                break
+    for i in sorted(hits)[:7]:
+        src = data.mind.sources[i]
+        related.append({
+            "id": src.id,
+            "title": src.title,
+            "url": src.url,
+            "domain": src.domain,
+            "excerpt": src.text[:300] + "..."
+        })
     
     return {
         "index": delta_index,
@@ -650,78 +953,42 @@ def get_pulse_detail(delta_index: int):
 @app.get("/api/forecast/{forecast_id}")
 def get_forecast_detail(forecast_id: str):
     """Forecast detail with history."""
-    if not DATA_PATH.exists():
+    cache = portal_cache()
+    if cache is None:
         raise HTTPException(404, "No data")
     
-    data = PortalData.from_json_file(str(DATA_PATH))
-    forecast = next((f for f in data.mind.forecasts if f.id == forecast_id), None)
+    forecast = cache.forecast_details.get(forecast_id)
     
     if not forecast:
         raise HTTPException(404, f"Forecast {forecast_id} not found")
     
-    return {
-        "id": forecast.id,
-        "question": forecast.question,
-        "probability": forecast.probability,
-        "probability_pct": f"{forecast.probability * 100:.0f}%",
-        "resolution_date": forecast.resolution_date.isoformat() if hasattr(forecast.resolution_date, 'isoformat') else str(forecast.resolution_date),
-        "resolution_criteria": forecast.resolution_criteria,
-        "status": forecast.status,
-        "outcome": forecast.outcome,
-        "brier_score": forecast.brier_score,
-        "created_at": forecast.created_at.isoformat() if hasattr(forecast.created_at, 'isoformat') else str(forecast.created_at)
-    }
+    return forecast
 
 @app.get("/api/ledger")
 def get_ledger(limit: int = 50, offset: int = 0):
     """Paginated truth ledger."""
-    if not DATA_PATH.exists():
+    cache = portal_cache()
+    if cache is None:
         raise HTTPException(404, "No data")
     
-    data = PortalData.from_json_file(str(DATA_PATH))
-    ledger = data.mind.ledger or []
-    
-    return {
-        "total": len(ledger),
-        "offset": offset,
-        "limit": limit,
-        "entries": [
-            {
-                "id": e.id,
-                "timestamp": e.timestamp.isoformat() if hasattr(e.timestamp, 'isoformat') else str(e.timestamp),
-                "type": e.type,
-                "payload": e.payload,
-                "prev_hash": e.prev_hash
-            }
-            for e in reversed(ledger[offset:offset + limit])
-        ]
-    }
+    ledger = cache.ledger_rows
+    entries = reversed(ledger[offset:offset + limit])
+    return stream_json_list({"total": len(ledger), "offset": offset, "limit": limit}, "entries", entries)
 
 @app.get("/api/sources")
 def get_sources(limit: int = 50, domain: Optional[str] = None):
     """Paginated sources."""
-    if not DATA_PATH.exists():
+    cache = portal_cache()
+    if cache is None:
         raise HTTPException(404, "No data")
     
-    data = PortalData.from_json_file(str(DATA_PATH))
-    sources = data.mind.sources or []
+    sources = cache.source_cards
     
     if domain:
-        sources = [s for s in sources if domain.lower() in s.domain.lower()]
+        domain_lc = domain.lower()
+        sources = [s for s, d in zip(sources, cache.source_domains) if domain_lc in d]
     
-    return {
-        "total": len(sources),
-        "sources": [
-            {
-                "id": s.id,
-                "title": s.title,
-                "url": s.url,
-                "domain": s.domain,
-                "excerpt": s.text[:200] + "..."
-            }
-            for s in sources[:limit]
-        ]
-    }
+    return stream_json_list({"total": len(sources)}, "sources", sources[:limit])
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -733,6 +1000,19 @@ if __name__ == "__main__":
     import uvicorn
     
     if "--generate" in sys.argv:
-        asyncio.run(run_full_pipeline())
+        try:
+            import uvloop
+        except ImportError:
+            uvloop = None
+        
+        async def generate_once():
+            try:
+                await run_full_pipeline()
+            finally:
+                # Close the model clients' pooled connections before the loop exits
+                await get_deliberation_engine().aclose()
+        
+        (uvloop.run if uvloop else asyncio.run)(generate_once())
     else:
-        uvicorn.run("server:app", host="0.0.0.0", port=8083, reload=True)
+        # loop/http "auto" pick uvloop + httptools when installed (uvicorn[standard])
+        uvicorn.run("server:app", host="0.0.0.0", port=8083, loop="auto", http="auto", reload=True)
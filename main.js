@@ -360,8 +360,9 @@ function connectLiveStream() {
 
     EVENT_SOURCE.onmessage = (e) => {
       try {
-        const event = JSON.parse(e.data);
-        handleLiveEvent(event);
+        // Bursts of events arrive batched as one JSON array
+        const data = JSON.parse(e.data);
+        (Array.isArray(data) ? data : [data]).forEach(handleLiveEvent);
       } catch (err) { }
     };
 
@@ -0,0 +1,25 @@
+"""Shared pytest setup: make the context-engine modules importable."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "context-engine"))
+
+# Modules whose functools caches must not leak state between tests
+CACHED_MODULES = ("data_schema", "council", "ingest")
+
+
+@pytest.fixture(autouse=True)
+def _clear_lru_caches():
+    """Clear module-level lru_caches after each test (production keeps them)."""
+    yield
+    for name in CACHED_MODULES:
+        module = sys.modules.get(name)
+        if module is None:
+            continue
+        for obj in vars(module).values():
+            # Only the module's own caches, not ones it imported (e.g. urllib's urlsplit)
+            if getattr(obj, "__module__", None) == name and callable(getattr(obj, "cache_clear", None)):
+                obj.cache_clear()
@@ -4,33 +4,54 @@ Tests for ingestion, deliberation, forecasting, and ledger integrity.
 """
 
 import pytest
-import sys
-from pathlib import Path
 from datetime import datetime, timedelta
 
-# Add context-engine to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "context-engine"))
-
 from data_schema import (
     PortalData, Meta, LivingMind, Source, Forecast, 
     LedgerEntry, RealityDelta, Risk, LivingBelief, TimePoint, MentalModelUpdate
 )
-from ingest import IngestEngine
+from ingest import IngestEngine, normalize_url
+from fast_feed import parse_feed, parse_feed_stream
+from bloom import BloomFilter
 from council import CouncilEngine
 
+# Fixed clock: these timestamps only fill required fields, never compare against real time
+_NOW = datetime(2026, 1, 7, 12, 0, 0)
+_TOMORROW = _NOW + timedelta(days=1)
+_PLUS30 = _NOW + timedelta(days=30)
+
+_GENESIS = LedgerEntry.create("SYSTEM_UPDATE", {"message": "Genesis"}, "0" * 16)
+
+# (probability, outcome, expected Brier score)
+_BRIER_CASES = [
+    (0.9, True, 0.01),
+    (0.9, False, 0.81),
+    (0.5, True, 0.25),
+    (0.5, False, 0.25),
+    (0.1, True, 0.81),
+    (0.1, False, 0.01),
+]
+
+# Forecast fields that don't matter to the Brier-score tests
+_BRIER_FORECAST = dict(
+    question="Test",
+    created_at=_NOW,
+    resolution_date=_TOMORROW,
+    resolution_criteria="Test"
+)
 
 # ═══════════════════════════════════════════════════════════════
 # FIXTURES
 # ═══════════════════════════════════════════════════════════════
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_source():
     return Source(
         id="test123",
         url="https://example.com/article",
         title="Test Article",
         text="This is a test article about AI developments.",
-        timestamp=datetime.utcnow(),
+        timestamp=_NOW,
         domain="example.com",
         source="Test Feed"
     )
@@ -40,29 +61,33 @@ def sample_forecast():
     return Forecast(
         id="fc-test-001",
         question="Will this test pass?",
-        created_at=datetime.utcnow(),
-        resolution_date=datetime.utcnow() + timedelta(days=30),
+        created_at=_NOW,
+        resolution_date=_PLUS30,
         resolution_criteria="pytest returns exit code 0",
         probability=0.95,
         status="open"
     )
 
-@pytest.fixture
-def sample_mind():
-    return LivingMind(
+@pytest.fixture(scope="session")
+def _sample_mind_template():
+    """Built once; read-only tests may use it directly, mutating tests take sample_mind.
+    
+    Trusted literal input, so model_construct skips validation.
+    """
+    return LivingMind.model_construct(
         sources=[],
         forecasts=[],
         ledger=[],
         deltas=[
-            RealityDelta(type="signal", text="Test signal", magnitude=10, sentiment="positive")
+            RealityDelta.model_construct(type="signal", text="Test signal", magnitude=10, sentiment="positive")
         ],
-        update=MentalModelUpdate(
+        update=MentalModelUpdate.model_construct(
             matters="Test matters",
             confidence="High",
             unresolved="Nothing"
         ),
         beliefs=[
-            LivingBelief(
+            LivingBelief.model_construct(
                 id="belief-1",
                 statement="Tests are valuable",
                 status="active",
@@ -70,11 +95,11 @@ def sample_mind():
                 last_challenged="2026-01-07",
                 evidence_for="Code quality",
                 evidence_against="Time cost",
-                history=[TimePoint(date="2026-01-07", value=90)]
+                history=[TimePoint.model_construct(date="2026-01-07", value=90)]
             )
         ],
         risks=[
-            Risk(
+            Risk.model_construct(
                 id="risk-1",
                 text="Test might fail",
                 status="developing",
@@ -85,6 +110,40 @@ def sample_mind():
     )
 
 
+@pytest.fixture
+def sample_mind(_sample_mind_template):
+    return _sample_mind_template.model_copy(deep=True)
+
+@pytest.fixture(scope="session")
+def empty_mind():
+    """A default LivingMind. Read-only; mutating tests take fresh_mind."""
+    return LivingMind()
+
+@pytest.fixture
+def fresh_mind(empty_mind):
+    return empty_mind.model_copy(deep=True)
+
+@pytest.fixture(scope="session")
+def prebuilt_ledger_mind(empty_mind):
+    """A LivingMind whose ledger holds 5 chained INGEST entries. Read-only."""
+    mind = empty_mind.model_copy(deep=True)
+    # The chain is what's under test, so skip validating the sources
+    sources = [
+        Source.model_construct(
+            id=f"src-{i}",
+            url=f"https://test.com/{i}",
+            title=f"Article {i}",
+            text=f"Content {i}",
+            timestamp=_NOW,
+            domain="test.com"
+        )
+        for i in range(5)
+    ]
+    for s in sources:
+        mind.add_source(s)
+    return mind
+
+
 # ═══════════════════════════════════════════════════════════════
 # DATA SCHEMA TESTS
 # ═══════════════════════════════════════════════════════════════
@@ -115,8 +174,8 @@ class TestDataSchema:
         f = Forecast(
             id="fc-1",
             question="Test?",
-            created_at=datetime.utcnow(),
-            resolution_date=datetime.utcnow() + timedelta(days=30),
+            created_at=_NOW,
+            resolution_date=_PLUS30,
             resolution_criteria="Test",
             probability=0.5
         )
@@ -134,8 +193,8 @@ class TestDataSchema:
         f = Forecast(
             id="fc-wrong",
             question="Will this fail?",
-            created_at=datetime.utcnow(),
-            resolution_date=datetime.utcnow() + timedelta(days=30),
+            created_at=_NOW,
+            resolution_date=_PLUS30,
             resolution_criteria="Test",
             probability=0.9
         )
@@ -144,12 +203,11 @@ class TestDataSchema:
     
     def test_ledger_entry_hash_chain(self):
         """Ledger entries should form a hash chain."""
-        entry1 = LedgerEntry.create("SYSTEM_UPDATE", {"message": "Genesis"}, "0000000000000000")
-        entry2 = LedgerEntry.create("INGEST", {"title": "Test"}, entry1.id)
+        entry = LedgerEntry.create("INGEST", {"title": "Test"}, _GENESIS.id)
         
-        assert entry1.prev_hash == "0000000000000000"
-        assert entry2.prev_hash == entry1.id
-        assert entry1.id != entry2.id
+        assert _GENESIS.prev_hash == "0000000000000000"
+        assert entry.prev_hash == _GENESIS.id
+        assert entry.id != _GENESIS.id
     
     def test_living_mind_add_source_dedup(self, sample_mind, sample_source):
         """LivingMind should deduplicate sources by ID."""
@@ -158,33 +216,267 @@ class TestDataSchema:
         
         sample_mind.add_source(sample_source)
         assert len(sample_mind.sources) == 1
+        assert len(sample_mind.ledger) == 1  # The duplicate isn't re-logged either
         
         other = Source(
             id="other456",
             url="https://other.com",
             title="Other",
             text="Other text",
-            timestamp=datetime.utcnow(),
+            timestamp=_NOW,
             domain="other.com"
         )
         sample_mind.add_source(other)
         assert len(sample_mind.sources) == 2
     
-    def test_portal_data_serialization(self, sample_mind):
+    def test_ledger_is_append_only(self, fresh_mind):
+        """Appending to the ledger should never rewrite earlier entries."""
+        fresh_mind._append_ledger("SYSTEM_UPDATE", {"msg": "First"})
+        first_hash = fresh_mind.ledger[0].id
+        
+        fresh_mind._append_ledger("SYSTEM_UPDATE", {"msg": "Second"})
+        assert len(fresh_mind.ledger) == 2
+        assert fresh_mind.ledger[0].id == first_hash
+        assert fresh_mind.ledger[1].prev_hash == first_hash
+    
+    def test_portal_data_serialization(self, _sample_mind_template):
         """PortalData should serialize to/from JSON."""
         data = PortalData(
             meta=Meta(date="January 7, 2026"),
-            mind=sample_mind
+            mind=_sample_mind_template
         )
-        json_dict = data.model_dump()
-        assert "meta" in json_dict
-        assert "mind" in json_dict
+        raw = data.model_dump_json()
+        assert '"meta"' in raw and '"mind"' in raw
+        assert PortalData.model_validate_json(raw) == data
+    
+    def test_portal_data_file_round_trip(self, _sample_mind_template, tmp_path):
+        """to_json_file should replace the target atomically and load back intact."""
+        path = tmp_path / "data.json"
+        data = PortalData(meta=Meta(date="January 7, 2026"), mind=_sample_mind_template)
+        data.to_json_file(str(path))
+        
+        assert not (tmp_path / "data.json.tmp").exists()
+        assert PortalData.from_json_file(str(path)) == data
+
+
+# ═══════════════════════════════════════════════════════════════
+# INGEST TESTS
+# ═══════════════════════════════════════════════════════════════
+
+class TestIngest:
+    
+    def test_normalize_url_strips_tracking(self):
+        """Tracking params and fragments should not distinguish articles."""
+        assert normalize_url("https://x.com/a?utm_source=rss&id=7#top") == "https://x.com/a?id=7"
+        assert normalize_url("https://x.com/a?utm_medium=feed") == "https://x.com/a"
+        assert normalize_url("HTTPS://X.com/a/") == "https://x.com/a"
+    
+    def test_parse_feed_stream_rss_and_atom(self):
+        """Streaming parser should yield feedparser-shaped entries for RSS and Atom."""
+        rss = b"""<?xml version="1.0"?><rss><channel><title>Feed</title>
+<item><title>One</title><link>https://x.com/1</link><description>First</description></item>
+<item><title>Two</title><link>https://x.com/2</link><description>Second</description></item>
+</channel></rss>"""
+        atom = b"""<?xml version="1.0"?><feed xmlns="http://www.w3.org/2005/Atom">
+<entry><title>Three</title><link rel="alternate" href="https://x.com/3"/><summary>Third</summary></entry>
+</feed>"""
+        entries = parse_feed_stream(rss)
+        assert [e["title"] for e in entries] == ["One", "Two"]
+        assert entries[0]["link"] == "https://x.com/1"
+        source = Source.from_feed_entry(parse_feed_stream(atom)[0], "Atom")
+        assert source.url == "https://x.com/3"
+        assert source.text == "Third"
+        assert [e["title"] for e in parse_feed_stream(rss, max_items=1)] == ["One"]
+        rdf = b"""<?xml version="1.0"?><rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+ xmlns="http://purl.org/rss/1.0/" xmlns:dc="http://purl.org/dc/elements/1.1/">
+<item rdf:about="https://x.com/4"><title>Four</title><link>https://x.com/4</link>
+<description>Fourth</description><dc:date>2026-01-07T12:00:00Z</dc:date></item>
+</rdf:RDF>"""
+        entry = parse_feed_stream(rdf)[0]
+        assert (entry["title"], entry["link"], entry["summary"]) == ("Four", "https://x.com/4", "Fourth")
+        assert entry["published"] == "2026-01-07T12:00:00Z"
+
+    def test_parse_feed_stream_ignores_extension_children(self):
+        """media:/itunes: children must not shadow the core title/content fields."""
+        rss = b"""<?xml version="1.0"?><rss xmlns:media="http://search.yahoo.com/mrss/"
+ xmlns:itunes="http://www.itunes.com/dtds/podcast-1.0.dtd"
+ xmlns:content="http://purl.org/rss/1.0/modules/content/"><channel>
+<item><media:title>Thumb caption</media:title><itunes:summary>Promo</itunes:summary>
+<media:content url="https://x.com/t.jpg"/><title>Real title</title><link>https://x.com/1</link>
+<content:encoded>&lt;p&gt;Body text&lt;/p&gt;</content:encoded></item>
+</channel></rss>"""
+        source = Source.from_feed_entry(parse_feed_stream(rss)[0], "Media")
+        assert source.title == "Real title"
+        assert source.text == "<p>Body text</p>"
+
+    def test_parse_feed_falls_back_on_malformed_xml(self):
+        """Feeds that aren't well-formed XML should still parse via feedparser."""
+        broken = b"<rss><channel><item><title>Caf&eacute;</title><link>https://x.com/c</link></item></channel></rss>"
+        entries = parse_feed(broken)
+        assert entries[0]["link"] == "https://x.com/c"
+
+    def test_parse_feed_falls_back_on_multibyte_encoding(self):
+        """expat can't decode gb2312 and friends; feedparser should take over."""
+        feed = '<?xml version="1.0" encoding="gb2312"?><rss><channel><item><title>新闻</title><link>https://x.com/g</link></item></channel></rss>'
+        entries = parse_feed(feed.encode("gb2312"))
+        assert (entries[0]["title"], entries[0]["link"]) == ("新闻", "https://x.com/g")
+    
+    def test_bloom_filter_persists(self, tmp_path):
+        """Seen-article signatures should survive a save/load round trip."""
+        path = str(tmp_path / "seen.bloom")
+        bloom = BloomFilter(capacity=1000)
+        sig = BloomFilter.signature("https://x.com/1", "One")
+        bloom.add(sig)
+        bloom.save(path)
+        
+        loaded = BloomFilter.load(path, capacity=1000)
+        assert sig in loaded
+        assert BloomFilter.signature("https://x.com/2", "Two") not in loaded
+    
+    async def test_fetch_rss_reuses_cache_on_not_modified(self, tmp_path):
+        """A 304 answer should return the previous run's sources without a body."""
+        import httpx
+        rss = b"<rss><channel><item><title>One</title><link>https://x.com/1</link></item></channel></rss>"
+        
+        def handler(request):
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, content=rss, headers={"ETag": '"v1"'})
+        
+        engine = IngestEngine(feed_cache_path=str(tmp_path / "feeds_cache.json"))
+        engine._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        feed = {"name": "X", "url": "https://x.com/rss"}
+        async with engine:
+            first = await engine.fetch_rss(feed)
+            second = await engine.fetch_rss(feed)
+        assert [s.title for s in first] == ["One"]
+        assert [s.url for s in second] == ["https://x.com/1"]
+    
+    async def test_ingest_all_dedups_across_feeds(self, monkeypatch):
+        """The same article syndicated by two feeds should be kept once."""
+        import ingest
+        feeds = [{"name": "A", "url": "https://a.com/rss"}, {"name": "B", "url": "https://b.com/rss"}]
+        monkeypatch.setattr(ingest, "RSS_SOURCES", feeds)
+        
+        def entry(url):
+            return Source.from_feed_entry({"link": url, "title": "Same", "summary": "Body"}, "Test")
+        
+        async def fake_fetch(feed_config):
+            if feed_config["name"] == "A":
+                return [entry("https://x.com/story?utm_source=a")]
+            return [entry("https://x.com/story?utm_source=b"), entry("https://x.com/other")]
+        
+        engine = IngestEngine(feed_cache_path=None)
+        monkeypatch.setattr(engine, "fetch_rss", fake_fetch)
+        stats = await engine.ingest_all()
+        assert stats["total_fetched"] == 3
+        assert stats["unique_sources"] == 2
+
+    async def test_ingest_all_caps_to_newest_sources(self, monkeypatch):
+        """max_sources should keep the K newest, ordered like the uncapped sort."""
+        import ingest
+        monkeypatch.setattr(ingest, "RSS_SOURCES", [{"name": "A", "url": "https://a.com/rss"}])
+        sources = [
+            Source(id=f"s{i}", url=f"https://x.com/{i}", title=str(i), text="",
+                   timestamp=_NOW + timedelta(hours=h), domain="x.com")
+            for i, h in enumerate([3, 7, 1, 9, 5])
+        ]
+
+        async def fake_fetch(feed_config):
+            return list(sources)
+
+        async def ingest_with(cap):
+            engine = IngestEngine(feed_cache_path=None, seen_filter_path=None, max_sources=cap)
+            monkeypatch.setattr(engine, "fetch_rss", fake_fetch)
+            return [s.title for s in (await engine.ingest_all())["sources"]]
+
+        uncapped = await ingest_with(None)
+        assert uncapped == ["3", "1", "4", "0", "2"]
+        assert await ingest_with(3) == uncapped[:3]
+
+    async def test_seen_filter_skips_unkept_articles(self, monkeypatch, tmp_path):
+        """Articles from a feed cancelled after parsing must stay unseen for the next run."""
+        import asyncio
+        import httpx
+        import ingest
+        feeds = [{"name": "Fast", "url": "https://a.com/rss"}, {"name": "Slow", "url": "https://b.com/rss"}]
+        monkeypatch.setattr(ingest, "RSS_SOURCES", feeds)
+        monkeypatch.setattr(ingest, "INGEST_TIMEOUT", 0.2)
+
+        def rss(n):
+            return f"<rss><channel><item><title>{n}</title><link>https://x.com/{n}</link></item></channel></rss>".encode()
+
+        stall = True
+
+        async def handler(request):
+            return httpx.Response(200, content=rss(request.url.host))
+
+        async def on_event(event):
+            if event.source == "Slow" and event.status == "complete" and stall:
+                await asyncio.sleep(5)  # Parsed, then cancelled at the deadline
+
+        path = str(tmp_path / "seen.bloom")
+
+        async def run():
+            engine = IngestEngine(event_callback=on_event, feed_cache_path=None, seen_filter_path=path)
+            engine._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with engine:
+                return await engine.ingest_all()
+
+        first = await run()
+        assert [s.title for s in first["sources"]] == ["a.com"]
+        stall = False
+        second = await run()
+        assert [s.title for s in second["sources"]] == ["b.com"]
+
+    async def test_seen_filter_ignores_tracking_params(self, monkeypatch, tmp_path):
+        """A syndicated copy with different utm_* params is the same article next run."""
+        import httpx
+        import ingest
+        monkeypatch.setattr(ingest, "RSS_SOURCES", [{"name": "A", "url": "https://a.com/rss"}])
+        utm = "a"
+
+        async def handler(request):
+            return httpx.Response(200, content=(
+                f"<rss><channel><item><title>Story</title>"
+                f"<link>https://x.com/story?utm_source={utm}</link></item></channel></rss>"
+            ).encode())
+
+        path = str(tmp_path / "seen.bloom")
+
+        async def run():
+            engine = IngestEngine(feed_cache_path=None, seen_filter_path=path)
+            engine._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with engine:
+                return await engine.ingest_all()
+
+        assert (await run())["unique_sources"] == 1
+        utm = "b"
+        assert (await run())["unique_sources"] == 0
 
 
 # ═══════════════════════════════════════════════════════════════
 # COUNCIL TESTS
 # ═══════════════════════════════════════════════════════════════
 
+_EXTRACTOR_RAW = """CLAIM: AI models are improving rapidly | SOURCE: TechCrunch | CONFIDENCE: high
+CLAIM: Regulation is lagging | SOURCE: Reuters | CONFIDENCE: medium
+SIGNAL: Investment in AI | DIRECTION: up | MAGNITUDE: 8"""
+
+_SKEPTIC_RAW = """COUNTER: Models may be overfitting | TARGET: AI improvement claims | STRENGTH: moderate
+RISK: Training data may be exhausted | SEVERITY: high"""
+
+_FORECASTS_RAW = """FORECAST: Will GPT-5 launch by July 2026? | PROB: 0.35 | DATE: 2026-07-01 | CRITERIA: OpenAI announces GPT-5
+FORECAST: Will EU AI Act be enforced? | PROB: 0.80 | DATE: 2026-06-30 | CRITERIA: First enforcement action taken"""
+
+@pytest.fixture(scope="module")
+def engine():
+    return CouncilEngine()
+
+@pytest.fixture(scope="module")
+def extractor_result(engine):
+    return engine._parse_extractor(_EXTRACTOR_RAW)
+
 class TestCouncil:
     
     def test_council_config_has_four_agents(self):
@@ -196,34 +488,24 @@ class TestCouncil:
         assert "analyst" in COUNCIL
         assert "forecaster" in COUNCIL
     
-    def test_council_parse_extractor(self):
+    def test_council_parse_extractor(self, extractor_result):
         """_parse_extractor should handle claim/signal format."""
-        engine = CouncilEngine()
-        raw = """CLAIM: AI models are improving rapidly | SOURCE: TechCrunch | CONFIDENCE: high
-CLAIM: Regulation is lagging | SOURCE: Reuters | CONFIDENCE: medium
-SIGNAL: Investment in AI | DIRECTION: up | MAGNITUDE: 8"""
-        result = engine._parse_extractor(raw)
+        result = extractor_result
         assert len(result["claims"]) == 2
         assert len(result["signals"]) == 1
         assert result["claims"][0]["text"] == "AI models are improving rapidly"
         assert result["signals"][0]["direction"] == "up"
     
-    def test_council_parse_skeptic(self):
+    def test_council_parse_skeptic(self, engine):
         """_parse_skeptic should handle counter/risk format."""
-        engine = CouncilEngine()
-        raw = """COUNTER: Models may be overfitting | TARGET: AI improvement claims | STRENGTH: moderate
-RISK: Training data may be exhausted | SEVERITY: high"""
-        result = engine._parse_skeptic(raw)
+        result = engine._parse_skeptic(_SKEPTIC_RAW)
         assert len(result["counters"]) == 1
         assert len(result["risks"]) == 1
         assert result["risks"][0]["severity"] == "high"
     
-    def test_council_parse_forecasts(self):
+    def test_council_parse_forecasts(self, engine):
         """_parse_forecasts should create valid Forecast objects."""
-        engine = CouncilEngine()
-        raw = """FORECAST: Will GPT-5 launch by July 2026? | PROB: 0.35 | DATE: 2026-07-01 | CRITERIA: OpenAI announces GPT-5
-FORECAST: Will EU AI Act be enforced? | PROB: 0.80 | DATE: 2026-06-30 | CRITERIA: First enforcement action taken"""
-        forecasts = engine._parse_forecasts(raw)
+        forecasts = engine._parse_forecasts(_FORECASTS_RAW)
         assert len(forecasts) == 2
         assert forecasts[0].probability == 0.35
         assert forecasts[1].probability == 0.80
@@ -233,11 +515,12 @@ FORECAST: Will EU AI Act be enforced? | PROB: 0.80 | DATE: 2026-06-30 | CRITERIA
 # INTEGRATION TESTS
 # ═══════════════════════════════════════════════════════════════
 
+@pytest.mark.slow
 class TestIntegration:
     
-    def test_full_mind_construction(self, sample_source):
+    def test_full_mind_construction(self, fresh_mind, sample_source):
         """Test building a complete LivingMind with all components."""
-        mind = LivingMind()
+        mind = fresh_mind
         
         mind.add_source(sample_source)
         assert len(mind.sources) == 1
@@ -246,8 +529,8 @@ class TestIntegration:
         f = Forecast(
             id="fc-int-1",
             question="Integration test passes?",
-            created_at=datetime.utcnow(),
-            resolution_date=datetime.utcnow() + timedelta(days=1),
+            created_at=_NOW,
+            resolution_date=_TOMORROW,
             resolution_criteria="pytest exit 0",
             probability=0.99
         )
@@ -260,46 +543,41 @@ class TestIntegration:
         assert mind.forecasts[0].brier_score is not None
         assert len(mind.ledger) == 3
     
-    def test_ledger_integrity(self):
+    def test_ledger_integrity(self, prebuilt_ledger_mind):
         """Ledger should maintain hash chain integrity."""
-        mind = LivingMind()
-        
-        for i in range(5):
-            s = Source(
-                id=f"src-{i}",
-                url=f"https://test.com/{i}",
-                title=f"Article {i}",
-                text=f"Content {i}",
-                timestamp=datetime.utcnow(),
-                domain="test.com"
-            )
-            mind.add_source(s)
+        mind = prebuilt_ledger_mind
+        assert len(mind.ledger) == 5
+        assert all(b.prev_hash == a.id for a, b in zip(mind.ledger, mind.ledger[1:]))
+    
+    def test_mean_brier_score(self, fresh_mind):
+        """Resolving a forecast should update the mind's mean Brier score."""
+        f = Forecast(id="fc-mean", probability=0.8, **_BRIER_FORECAST)
+        fresh_mind.add_forecast(f)
+        fresh_mind.resolve_forecast("fc-mean", True)
         
-        for i in range(1, len(mind.ledger)):
-            assert mind.ledger[i].prev_hash == mind.ledger[i-1].id
+        assert f.brier_score == 0.04  # (0.8 - 1.0)^2
+        assert fresh_mind.stats["mean_brier_score"] == 0.04
     
-    def test_brier_score_calculation_accuracy(self):
+    @pytest.mark.parametrize("prob,outcome,expected_brier", _BRIER_CASES)
+    def test_brier_score_calculation_accuracy(self, prob, outcome, expected_brier):
         """Brier scores should be mathematically correct."""
-        test_cases = [
-            (0.9, True, 0.01),
-            (0.9, False, 0.81),
-            (0.5, True, 0.25),
-            (0.5, False, 0.25),
-            (0.1, True, 0.81),
-            (0.1, False, 0.01),
+        f = Forecast(id=f"fc-brier-{prob}-{outcome}", probability=prob, **_BRIER_FORECAST)
+        f.resolve(outcome)
+        assert f.brier_score == pytest.approx(expected_brier, abs=1e-3)
+    
+    def test_brier_formula_all_cases(self):
+        """Every case at once, against (p - o)^2 computed independently of resolve()."""
+        forecasts = [
+            Forecast(id=f"fc-all-{i}", probability=prob, **_BRIER_FORECAST)
+            for i, (prob, _, _) in enumerate(_BRIER_CASES)
         ]
-        
-        for prob, outcome, expected_brier in test_cases:
-            f = Forecast(
-                id=f"fc-brier-{prob}-{outcome}",
-                question="Test",
-                created_at=datetime.utcnow(),
-                resolution_date=datetime.utcnow() + timedelta(days=1),
-                resolution_criteria="Test",
-                probability=prob
-            )
+        for f, (_, outcome, _) in zip(forecasts, _BRIER_CASES):
             f.resolve(outcome)
-            assert abs(f.brier_score - expected_brier) < 0.001
+        
+        formula = [(prob - float(outcome)) ** 2 for prob, outcome, _ in _BRIER_CASES]
+        expected = [brier for _, _, brier in _BRIER_CASES]
+        assert formula == pytest.approx(expected, abs=1e-3)
+        assert [f.brier_score for f in forecasts] == pytest.approx(expected, abs=1e-3)
 
 
 if __name__ == "__main__":